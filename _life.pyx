@@ -0,0 +1,40 @@
+# cython: language_level=3
+"""
+A Universe.tick kernele C-re fordítva. Ha le van fordítva, a game_of_life.py ezt használja,
+egyébként a Numba-s, végső soron a NumPy-os változatot.
+Fordítás (a game_of_life.py mellé kerül a lefordított modul):
+    cythonize -i _life.pyx
+"""
+
+cimport cython
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef void step_rows(const unsigned char[:, ::1] b, unsigned char[:, ::1] o,
+                     Py_ssize_t y_start, Py_ssize_t y_stop):
+    """
+    Kiszámolja a b tábla [y_start, y_stop) sorainak következő generációját az o táblába.
+    A táblák körül egy halott sejtekből álló keret van, a keret belsejében minden sejt
+    határellenőrzés nélkül, a GIL elengedésével számolódik. A keretet nem írja, és más
+    sorokat sem, így a tábla több szálon, sávonként is számolható.
+    """
+
+    cdef Py_ssize_t width = b.shape[1], y, x
+    cdef int n
+
+    with nogil:
+        for y in range(y_start, y_stop):
+            for x in range(1, width - 1):
+                n = b[y - 1, x - 1] + b[y - 1, x] + b[y - 1, x + 1] \
+                    + b[y, x - 1] + b[y, x + 1] \
+                    + b[y + 1, x - 1] + b[y + 1, x] + b[y + 1, x + 1]
+                o[y, x] = 1 if n == 3 else (b[y, x] if n == 2 else 0)
+
+
+cpdef void step(const unsigned char[:, ::1] b, unsigned char[:, ::1] o):
+    """
+    Kiszámolja a b tábla következő generációját az o táblába, a keret összes belső során.
+    """
+
+    step_rows(b, o, 1, b.shape[0] - 1)
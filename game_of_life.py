@@ -1,30 +1,115 @@
 """
 https://en.wikipedia.org/wiki/Conway%27s_Game_of_Life
-Az alap ötlet, hogy minden sejt egy objektum, aminek referenciája van a szomszédjaira.
-Bár a sejtek bejárása nem e referenciák mentén történik, de ilyen szempontból egy nagy
-láncolt lista az egész program.
-A sejteket Cell-nek nevezem, és az a terület, ahol a sejtek léteznek az univerzum (Universe).
+Az univerzum (Universe) állapotát egy NumPy tömb tárolja, a következő generációt pedig
+lefordított kernel számolja ki, így a szimuláció C-szintű ciklusokban fut. A kernel a
+Cython-os _life modul, ha le van fordítva (lásd _life.pyx), egyébként a Numba-s változat,
+ha pedig Numba sincs, akkor tisztán NumPy-os tömbműveletek.
+Megmaradt a régi, referencia implementáció is (CellUniverse): ott minden sejt (Cell) egy
+objektum, aminek referenciája van a szomszédjaira. Bár a sejtek bejárása nem e referenciák
+mentén történik, de ilyen szempontból egy nagy láncolt lista az egész.
 Az alapműködés szerint a config_file.config tartalma kirajzolódik egy tkinter-es canvas-ra,
 és 200ms-os tick mellett elindul a szimuláció.
 """
 
+import argparse
+import functools
+import os
 import pathlib
-import re
 import tkinter as tk
-from typing import Optional, Type, TypedDict
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, TypedDict
+
+import numpy as np
+
+try:
+    # A _life.pyx lefordított változata, lásd ott
+    import _life
+except ImportError:
+    _life = None
+
+try:
+    from numba import njit, prange
+except ImportError:
+    # Numba nélkül NumPy-os tömbműveletek számolják a következő generációt
+    njit = prange = None
 
 # Rendereléshez
 TICK = 200  # Univerzum órája ms-ban
 CELL_SIZE_PX = 24  # Grid mérete renderelésnél
 
+# A Cython-os kernel legalább ennyi soros sávokban, párhuzamosan számolja a táblát.
+# Ennél kisebb sávokon a szálak koordinálása többe kerülne, mint amit nyerünk.
+STRIP_ROWS = 64
+
 # Tkinter-es color code-ok
 CELL_DEAD_COLOR = 'white'
 CELL_ALIVE_COLOR = 'black'
 
 
+@functools.lru_cache(maxsize=None)
+def _thread_pool() -> ThreadPoolExecutor:
+    # Az összes univerzum közös, tartós szálkészlete a sávonkénti tick-hez
+    return ThreadPoolExecutor(max_workers=os.cpu_count())
+
+
+if njit is not None:
+    @njit(inline='always')
+    def _next_cell_state(b, y, x):
+        # Lásd: game of life szabályrendszere. A szomszédok összeszámolása és a szabály egy lépésben.
+        n = b[y - 1, x - 1] + b[y - 1, x] + b[y - 1, x + 1] \
+            + b[y, x - 1] + b[y, x + 1] \
+            + b[y + 1, x - 1] + b[y + 1, x] + b[y + 1, x + 1]
+        return 1 if n == 3 else (b[y, x] if n == 2 else 0)
+
+    @njit(cache=True, parallel=True, boundscheck=False)
+    def _step_numba(b, o):
+        """
+        Kiszámolja a b tábla következő generációját az o táblába, soronként párhuzamosan.
+        A b és o táblák körül halott sejtekből álló keret van, így a széleken sem kell
+        határt ellenőrizni.
+        """
+
+        height, width = b.shape
+        for y in prange(1, height - 1):
+            for x in range(1, width - 1):
+                o[y, x] = _next_cell_state(b, y, x)
+
+else:
+    _step_numba = None
+
+
+# Egy tetszőleges sejt szomszédjainak relatív (x, y) koordinátái.
+# A koordináták az "O"-hoz képest relatívak, e szerint:
+#    Y
+#    ^
+#    |
+#    +---+---+---+
+# -1 |   |   |   |
+#    +---+---+---+
+#  0 |   | O |   |
+#    +---+---+---+
+#  1 |   |   |   |
+#    +---+---+---+  ---> X
+#     -1   0   1
+_OFFSETS = (
+    (0, -1),  # top
+    (1, -1),  # top_right
+    (1, 0),  # right
+    (1, 1),  # bottom_right
+    (0, 1),  # bottom
+    (-1, 1),  # bottom_left
+    (-1, 0),  # left
+    (-1, -1),  # top_left
+)
+
+
 # Az univerzum szélénél ne kelljen None-okat csekkolni.
 class NullCell:
-    _state = 0
+    __slots__ = ('_state',)
+
+    def __init__(self):
+        self._state = 0
 
 
 class Cell:
@@ -33,46 +118,25 @@ class Cell:
     igaz, ez csak a kirajzoláshoz és a debuggoláshoz kell.
     """
 
+    # Sejtből nagyon sok van: __dict__ helyett slotokban tároljuk az attribútumokat,
+    # ez kisebb memóriaigényt és gyorsabb attribútum-elérést jelent.
+    __slots__ = ('_state', 'pos_x', 'pos_y', '_n')
+
     # Az univerzum szélét singleton-nak tekintjük, ezért az class var
     NULL = NullCell()
 
     def __init__(self, is_alive: bool, pos_x: int, pos_y: int):
+        # Az állapotot property helyett közvetlenül, attribútumként olvassuk (1: él, 0: halott),
+        # így a szomszédok összeszámolásakor nincs plusz függvényhívás.
         self._state = int(is_alive)
 
-        # A sejt állapotváltozása nem végleges addig, amíg a self.commit() meghívásra nem kerül.
-        # Így a sejtek új állapotának megállapításához anélkül használhatjuk fel a régi éréket, hogy
-        # közben új univerzumot kéne építeni.
-        self._state_dirty = None
         self.pos_x = pos_x
         self.pos_y = pos_y
 
-        # Nem szeretném a környező sejteket index alapján kikeresni. Ez az objektum
-        # referenciákat tárol majd el a szomszédos sejtekre, és csinos apival lehet hivatkozni rájuk
-        self.neighbours = Neighbours()
-
-        # tkinter-es rectangle referenciája, a canvas update-hez kell majd
-        self.rectangle = None
-
-    @property
-    def is_alive(self):
-        return bool(self._state)
-
-    @is_alive.setter
-    def is_alive(self, alive: bool):
-        """
-        Ezzel a propertyvel szétválik a sejt aktuális- és végállapota
-        """
-
-        assert self._state_dirty is None
-        self._state_dirty = int(alive)
-
-    def commit(self):
-        """
-        Ez a metódus véglegesíti a sejt állapotát
-        """
-
-        self._state = self._state_dirty
-        self._state_dirty = None
+        # Nem szeretném a környező sejteket index alapján kikeresni. Ez a lista
+        # referenciákat tárol majd el a szomszédos sejtekre, _OFFSETS sorrendjében.
+        # Az univerzum konstruktora tölti fel.
+        self._n: Optional[list[Cell]] = None
 
     def __repr__(self):
         """
@@ -82,87 +146,17 @@ class Cell:
         return f'<Cell({self.pos_x}, {self.pos_y})>'
 
 
-class Neighbour:
-    """
-    Ez egy descriptor osztály.
-    Ha osztályváltozóként viselkedik, akkor relatív indexeket ad vissza, amivel
-    megállapítható lesz a sejt szomszédsága. Ilyen szempontból ezek a descriptorok
-    konstansokként/enumként viselkednek.
-    Ezeket az indexeket majd az Universe konstruktora hasznosítja.
-    Ha példványváltozóként használod, akkor visszatér a szomszédos cellával, vagy a NullCell
-    referenciájával, ha az univerzum szélén vagyunk.
-    Technikailag lehet fekete lyuk is az univerzumban.
-    """
-
-    def __init__(self, x: int, y: int):
-        self.x = x
-        self.y = y
-        self._name: Optional[str] = None
-
-    def __set_name__(self, owner: Type['Neighbours'], name: str):
-        self._name = name
-
-    def __get__(self, instance: Optional['Neighbours'], owner: Type['Neighbours']):
-        if instance is None:
-            return self
-
-        else:
-            return instance.__dict__.get(self._name, Cell.NULL)
-
-    def __set__(self, instance: Optional['Neighbours'], value):
-        if value is not None:
-            instance.__dict__[self._name] = value
-
-
-class Neighbours:
-    """
-    Ezek a descriptorok kódolják, hogy egy tetszőleges sejt szomszédjainak
-    mik a relatív koordinátái.
-    A koordináták az "O"-hoz képest relatívak, e szerint:
-       Y
-       ^
-       |
-       +---+---+---+
-    -1 |   |   |   |
-       +---+---+---+
-     0 |   | O |   |
-       +---+---+---+
-     1 |   |   |   |
-       +---+---+---+  ---> X
-        -1   0   1
-    """
-
-    top = Neighbour(0, -1)
-    top_right = Neighbour(1, -1)
-    right = Neighbour(1,  0)
-    bottom_right = Neighbour(1,  1)
-    bottom = Neighbour(0,  1)
-    bottom_left = Neighbour(-1,  1)
-    left = Neighbour(-1,  0)
-    top_left = Neighbour(-1, -1)
-
-    def get_alive_count(self) -> int:
-        return self.top._state \
-            + self.top_right._state \
-            + self.right._state \
-            + self.bottom_right._state \
-            + self.bottom._state \
-            + self.bottom_left._state \
-            + self.left._state \
-            + self.top_left._state
-
-
-class Universe:
+class CellUniverse:
     """
-    Ez reprezentálja a sejtek (véges) univerzumát
+    Ez reprezentálja a sejtek (véges) univerzumát, sejt objektumokkal.
+    Ez a tisztán Python-os referencia implementáció, a Universe interfészét követi.
     """
 
     def __init__(self, width: int, height: int):
-        # Két kollekcióba gyűjtjük a sejtek referenciáját: az egyik az X-Y koordináta szerinti
-        # eléréshez gyors (ez a self._board), a másik az iteráláshoz (ez egy sima 1D-s tömb, a self._cells)
+        # A sejtek referenciáit az X-Y koordináta szerinti eléréshez gyűjtjük a self._board-ba.
+        # Az iteráláshoz a self._active halmazt használjuk, lásd lent.
         self._board: list[list[Cell]] = []
         board = self._board
-        self._cells: list[Cell] = []
 
         # Kevésbé stresszes felépíteni az univerzumot, ha két menetben tesszük azt:
         # 1. Létrehozzuk az összes cell-t. Így nem kell számolgatnunk, meg előre-hátra
@@ -175,73 +169,92 @@ class Universe:
             for col_ptr in range(width):
                 cell = Cell(False, col_ptr, row_ptr)
                 row.append(cell)
-                self._cells.append(cell)
-
-        def get_neighbour(neighbour: Neighbour) -> Optional[Cell]:
-            # Itt a classvart hasznosítjuk, aminek van x és y koordinátája.
-            # A nested functionben elérjük a külső ciklusváltozókat is
-
-            x = col_ptr + neighbour.x
-            y = row_ptr + neighbour.y
-
-            if -1 < x < width and -1 < y < height:
-                return board[y][x]
 
         # 2. Bejárjuk az összes cell-t, és beállítjuk, hogy kinek-merre-milyen szomszédja van.
+        # Az univerzumon kívüli szomszéd helyére a NullCell kerül.
         for row_ptr, row in enumerate(board):
             for col_ptr, cell in enumerate(row):
-                # Ezért érte meg ezeket a Neighbour descriptorokat megírni.
-                cell.neighbours.top = get_neighbour(Neighbours.top)
-                cell.neighbours.top_right = get_neighbour(Neighbours.top_right)
-                cell.neighbours.right = get_neighbour(Neighbours.right)
-                cell.neighbours.bottom_right = get_neighbour(
-                    Neighbours.bottom_right)
-                cell.neighbours.bottom = get_neighbour(Neighbours.bottom)
-                cell.neighbours.bottom_left = get_neighbour(
-                    Neighbours.bottom_left)
-                cell.neighbours.left = get_neighbour(Neighbours.left)
-                cell.neighbours.top_left = get_neighbour(Neighbours.top_left)
+                cell._n = [
+                    board[row_ptr + dy][col_ptr + dx]
+                    if -1 < col_ptr + dx < width and -1 < row_ptr + dy < height
+                    else Cell.NULL
+                    for dx, dy in _OFFSETS
+                ]
+
+        # Csak az élő sejtek és a szomszédaik állapota változhat, a tick csak ezeket járja be.
+        # Ritka univerzumban ez nagyságrendekkel kevesebb, mint az összes sejt.
+        self._active: set[Cell] = set()
+
+    def _activate(self, cell: Cell, active: set[Cell]):
+        # A sejtet és a szomszédait felvesszük az aktívak közé, a NullCell-t nem
+        active.add(cell)
+        active.update(cell._n)
+        active.discard(Cell.NULL)
 
     def __setitem__(self, key: tuple[int, int], is_alive: bool):
         # Az X, Y szerinti koordinátákat kételemű slice-olással lehet írni
         x, y = key
         cell = self._board[y][x]
-        cell.is_alive = is_alive
-        cell.commit()
+        cell._state = int(is_alive)
 
-    @property
-    def cells(self):
-        return self._cells
+        if is_alive:
+            self._activate(cell, self._active)
+
+    def __getitem__(self, key: tuple[int, int]) -> bool:
+        x, y = key
+        return bool(self._board[y][x]._state)
 
-    def tick(self):
+    def load_from_config(self, tabla: list[list[str]], alive_char: str):
         """
-        Lefuttat egy iterációt az univerzumban
+        Betölti a config táblájának állapotát az univerzumba.
         """
 
-        # Sokat gyorsít majd a kirajzolásnál, ha csak azokat a sejteket rajzoljuk újra,
-        # amelyek állapota megváltozott.
-        changed = []
+        for row_ptr, row in enumerate(tabla):
+            for col_ptr, cell in enumerate(row):
+                self[col_ptr, row_ptr] = cell == alive_char
+
+    def tick(self) -> list[tuple[int, int]]:
+        """
+        Lefuttat egy iterációt az univerzumban, és visszatér a megváltozott
+        sejtek (y, x) koordinátáival.
+        """
 
-        for cell in self._cells:
+        # Először csak összegyűjtjük a születő és elhaló sejteket, és csak utána írjuk át az
+        # állapotukat. Így a régi állapotok alapján számolunk, új univerzum építése nélkül.
+        born = []
+        died = []
+
+        for cell in self._active:
             # Lásd: game of life szabályrendszere
-            alive_neighbour_count = cell.neighbours.get_alive_count()
-            if cell.is_alive:
+            n = cell._n
+            alive_neighbour_count = n[0]._state + n[1]._state + n[2]._state + n[3]._state \
+                + n[4]._state + n[5]._state + n[6]._state + n[7]._state
+            if cell._state:
                 if not (alive_neighbour_count == 2 or alive_neighbour_count == 3):
-                    cell.is_alive = False
-                else:
-                    cell.is_alive = True
-                changed.append(cell)
+                    died.append(cell)
 
-            else:
-                if alive_neighbour_count == 3:
-                    cell.is_alive = True
-                    changed.append(cell)
+            elif alive_neighbour_count == 3:
+                born.append(cell)
+
+        for cell in born:
+            cell._state = 1
+        for cell in died:
+            cell._state = 0
 
-        # Minden levegőben lógó állapot véglegesítése
-        for cell in changed:
-            cell.commit()
+        # Minden élő sejt az aktívak között volt, ezekből és a szomszédaikból
+        # lesznek a következő tick aktív sejtjei.
+        next_active = set()
+        for cell in self._active:
+            if cell._state:
+                self._activate(cell, next_active)
 
-        return changed
+        self._active = next_active
+
+        # Sokat gyorsít majd a kirajzolásnál, ha csak azokat a sejteket rajzoljuk újra,
+        # amelyek állapota megváltozott.
+        changed = born + died
+
+        return [(cell.pos_y, cell.pos_x) for cell in changed]
 
     def to_list(self) -> list[list[bool]]:
         """
@@ -256,11 +269,554 @@ class Universe:
             retval_row = []
             retval.append(retval_row)
             for cell in row:
-                retval_row.append(cell.is_alive)
+                retval_row.append(bool(cell._state))
 
         return retval
 
 
+class Universe:
+    """
+    Ez reprezentálja a sejtek (véges) univerzumát.
+    A sejtek állapotát egy (height + 2, width + 2) alakú uint8 tömb tárolja: 1, ha él a sejt, 0, ha halott.
+    A tábla körül egy mindig halott sejtekből álló keret van, így a kerneleknek az univerzum szélén
+    sem kell határt ellenőrizniük, egyszerűen a keretbe olvasnak bele. Kívülről a view látszik.
+    """
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        # Két buffer: a _front az aktuális generáció, a _back-be számoljuk a következőt,
+        # majd tick végén helyet cserélnek. Így nincs szükség generációnként új tömbre.
+        self._front = np.zeros((height + 2, width + 2), dtype=np.uint8)
+        self._back = np.zeros_like(self._front)
+
+        # Lefordított kernel, ha van. A Numba-s változat magától is párhuzamos. A Cython-os kernel elengedi a GIL-t, így azt mi osztjuk szét
+        # a szálak között: a tábla sorait egyenletesen, legalább STRIP_ROWS soros sávokra bontjuk.
+        strip_count = min(os.cpu_count() or 1, height // STRIP_ROWS)
+        if _life is not None and strip_count > 1:
+            self._strips = [
+                (int(rows[0]), int(rows[-1]) + 1)
+                for rows in np.array_split(np.arange(1, height + 1), strip_count)
+            ]
+            self._step = self._step_strips
+        elif _life is not None:
+            self._step = _life.step
+        elif _step_numba is not None:
+            self._step = _step_numba
+        else:
+            self._step = None
+
+    def _step_strips(self, front: np.ndarray, back: np.ndarray):
+        # Minden sáv csak a saját sorait írja, a szomszédos sávok sorait csak olvassa
+        futures = [
+            _thread_pool().submit(_life.step_rows, front, back, y_start, y_stop)
+            for y_start, y_stop in self._strips
+        ]
+        for future in futures:
+            future.result()
+
+    @property
+    def view(self) -> np.ndarray:
+        """
+        Az aktuális generáció keret nélkül, (height, width) alakban
+        """
+
+        return self._front[1:-1, 1:-1]
+
+    def __setitem__(self, key: tuple[int, int], is_alive: bool):
+        # Az X, Y szerinti koordinátákat kételemű slice-olással lehet írni
+        x, y = key
+        self.view[y, x] = is_alive
+
+    def __getitem__(self, key: tuple[int, int]) -> bool:
+        x, y = key
+        return bool(self.view[y, x])
+
+    def load_from_config(self, tabla: list[list[str]], alive_char: str):
+        """
+        Betölti a config táblájának állapotát az univerzumba, egyetlen tömbös összehasonlítással.
+        """
+
+        self.view[...] = np.array(tabla) == alive_char
+
+    def tick(self) -> np.ndarray:
+        """
+        Lefuttat egy iterációt az univerzumban, és visszatér a megváltozott
+        sejtek koordinátáival: egy (n, 2) alakú tömb, soronként [y, x].
+        """
+
+        front = self._front
+        back = self._back
+
+        if self._step is not None:
+            self._step(front, back)
+
+        else:
+            # Minden sejtre egyszerre számoljuk ki az élő szomszédok számát: a nyolc irányba
+            # eltolt tábla összege. Az univerzumon kívül nincs élet, ezt a keret biztosítja.
+            neighbour_count = front[:-2, :-2] + front[:-2, 1:-1] + front[:-2, 2:] \
+                + front[1:-1, :-2] + front[1:-1, 2:] \
+                + front[2:, :-2] + front[2:, 1:-1] + front[2:, 2:]
+
+            # Lásd: game of life szabályrendszere. Három szomszéddal mindenképp él a sejt,
+            # kettővel csak akkor, ha eddig is élt.
+            np.logical_or(neighbour_count == 3, front[1:-1, 1:-1] & (neighbour_count == 2),
+                          out=back[1:-1, 1:-1])
+
+        self._front, self._back = back, front
+
+        # Sokat gyorsít majd a kirajzolásnál, ha csak azokat a sejteket rajzoljuk újra,
+        # amelyek állapota megváltozott.
+        changed_mask = self._front[1:-1, 1:-1] != self._back[1:-1, 1:-1]
+
+        return np.argwhere(changed_mask)
+
+    def to_list(self) -> list[list[bool]]:
+        """
+        Tömbök tömbjét adja vissza. A belső tömbök a tábla sorait reprezentálják.
+        A tömbök elemei bool-ok, ami ha True, akkor a sejt életben van. Ha halott, akkor False.
+        Ezt a metódust csak a feladatmegoldás hasznosítja. A belső működéshez és a rendereléshez
+        nincs rá szükség.
+        """
+        return self.view.astype(bool).tolist()
+
+
+def _half_add(a: np.ndarray, b: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    # Bitenkénti félösszeadó: (összeg, átvitel)
+    return a ^ b, a & b
+
+
+def _full_add(a: np.ndarray, b: np.ndarray, c: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    # Bitenkénti teljes összeadó: (összeg, átvitel)
+    partial = a ^ b
+    return partial ^ c, (a & b) | (partial & c)
+
+
+class BitPackedUniverse:
+    """
+    Ez is a sejtek (véges) univerzuma, de itt egy szó 64 sejtet tárol: a tábla egy
+    (height, ceil(width / 64)) alakú uint64 tömb, a sejt a (x // 64). szó (x % 64). bitje.
+    A szomszédok összeszámolása bitsíkokon (SWAR) történik: 64 sejtre egyszerre, néhány
+    shift-tel és logikai művelettel.
+    """
+
+    WORD_BITS = 64
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        word_count = -(-width // self.WORD_BITS)
+        self._board = np.zeros((height, word_count), dtype=np.uint64)
+
+        # Az utolsó szó width-en túli bitjeinek mindig nullának kell maradniuk,
+        # különben a szomszédos (nem létező) sejtek életre kelnének.
+        self._mask = np.full(word_count, np.iinfo(np.uint64).max, dtype=np.uint64)
+        if tail := width % self.WORD_BITS:
+            self._mask[-1] = np.uint64((1 << tail) - 1)
+
+    def __setitem__(self, key: tuple[int, int], is_alive: bool):
+        x, y = key
+        word, bit = divmod(x, self.WORD_BITS)
+        bit_mask = np.uint64(1 << bit)
+        if is_alive:
+            self._board[y, word] |= bit_mask
+        else:
+            self._board[y, word] &= ~bit_mask
+
+    def __getitem__(self, key: tuple[int, int]) -> bool:
+        x, y = key
+        word, bit = divmod(x, self.WORD_BITS)
+        return bool((int(self._board[y, word]) >> bit) & 1)
+
+    def load_from_config(self, tabla: list[list[str]], alive_char: str):
+        """
+        Lásd: Universe.load_from_config
+        """
+
+        # Bájtokba csomagoljuk a sorokat (x szerint növekvő bitsorrendben), majd szavakra
+        # kiegészítve little-endian uint64-ként olvassuk vissza őket.
+        packed = np.packbits(np.array(tabla) == alive_char, axis=1, bitorder='little')
+        padded = np.zeros((self.height, self._board.shape[1] * 8), dtype=np.uint8)
+        padded[:, :packed.shape[1]] = packed
+        self._board[...] = padded.view('<u8')
+
+    @staticmethod
+    def _shift_left(rows: np.ndarray) -> np.ndarray:
+        # Minden sejt helyére a tőle balra (x - 1) lévő sejt kerül, szóhatáron átnyúlva
+        shifted = rows << np.uint64(1)
+        shifted[:, 1:] |= rows[:, :-1] >> np.uint64(63)
+        return shifted
+
+    @staticmethod
+    def _shift_right(rows: np.ndarray) -> np.ndarray:
+        # Minden sejt helyére a tőle jobbra (x + 1) lévő sejt kerül, szóhatáron átnyúlva
+        shifted = rows >> np.uint64(1)
+        shifted[:, :-1] |= rows[:, 1:] << np.uint64(63)
+        return shifted
+
+    def tick(self) -> np.ndarray:
+        """
+        Lefuttat egy iterációt az univerzumban, és visszatér a megváltozott
+        sejtek koordinátáival: egy (n, 2) alakú tömb, soronként [y, x].
+        """
+
+        board = self._board
+
+        # A felette és alatta lévő sorok, az univerzumon kívül nincs élet
+        above = np.zeros_like(board)
+        above[1:] = board[:-1]
+        below = np.zeros_like(board)
+        below[:-1] = board[1:]
+
+        # A nyolc szomszéd, mindegyik egy bitsík
+        neighbours = (
+            self._shift_left(above), above, self._shift_right(above),
+            self._shift_left(board), self._shift_right(board),
+            self._shift_left(below), below, self._shift_right(below),
+        )
+
+        # Összeadóláncon a nyolc egybites szám összege négy bitsíkra bomlik (0-8)
+        s0, c0 = _full_add(*neighbours[0:3])
+        s1, c1 = _full_add(*neighbours[3:6])
+        s2, c2 = _half_add(*neighbours[6:8])
+        bit0, c3 = _full_add(s0, s1, s2)
+        t, c4 = _full_add(c0, c1, c2)
+        bit1, c5 = _half_add(t, c3)
+        bit2, bit3 = _half_add(c4, c5)
+
+        # Lásd: game of life szabályrendszere. A szomszédszám 3 (0011), vagy 2 (0010), ha a sejt él.
+        new_board = ~bit3 & ~bit2 & bit1 & (bit0 | board) & self._mask
+
+        changed_mask = self._unpack(new_board ^ board)
+        self._board = new_board
+
+        return np.argwhere(changed_mask)
+
+    def _unpack(self, words: np.ndarray) -> np.ndarray:
+        # uint8 tábla a kirajzoláshoz és az exporthoz. A little-endian nézet miatt
+        # a bájtok, és bennük a bitek is x szerint növekvő sorrendben jönnek.
+        as_bytes = words.astype('<u8').view(np.uint8)
+        return np.unpackbits(as_bytes, axis=1, count=self.width, bitorder='little')
+
+    def to_list(self) -> list[list[bool]]:
+        """
+        Lásd: Universe.to_list
+        """
+
+        return self._unpack(self._board).astype(bool).tolist()
+
+
+# Hashlife --------------------------------------------------------------------
+# A sík egy négyfa (quadtree): egy k szintű csomópont egy 2^k x 2^k-s négyzet, aminek négy
+# k - 1 szintű negyede van. A csomópontok kanonikusak (flyweight), azonos tartalmú négyzethez
+# ugyanaz az objektum tartozik, így az eredményeik az id(node) alapján memoizálhatók.
+# A kanonikus csomópontokat és az eredményeket a _NodeStore tartja nyilván.
+Node = namedtuple('Node', 'nw ne sw se level population hash')
+
+# A 0. szintű csomópontok maguk a sejtek
+_ON = Node(None, None, None, None, 0, 1, 1)
+_OFF = Node(None, None, None, None, 0, 0, 0)
+
+# Legfeljebb ennyi kanonikus csomópontot tart meg egy HashlifeUniverse, utána újrakezdi a cache-eit
+HASHLIFE_MAX_NODES = 500_000
+
+# 16 bites maszk -> a 4x4-es négyzet középső 2x2-esének (nw, ne, sw, se) állapota egy generációval
+# később. Legfeljebb 2^16 eleme lehet, ezért nyugodtan lehet közös.
+_LIFE_4X4: dict[int, tuple[int, int, int, int]] = {}
+
+
+def _is_padded(node: Node) -> bool:
+    # Igaz, ha minden élő sejt a csomópont középső 2^(k-2) x 2^(k-2)-es részében van
+    return node.nw.population == node.nw.se.se.population \
+        and node.ne.population == node.ne.sw.sw.population \
+        and node.sw.population == node.sw.ne.ne.population \
+        and node.se.population == node.se.nw.nw.population
+
+
+class _NodeStore:
+    """
+    Egy HashlifeUniverse kanonikus csomópontjai és memoizált eredményei. Univerzumonként külön
+    példány, így az egyik univerzum cache-ének ürítése nem érinti a többit.
+    """
+
+    def __init__(self):
+        # (id(nw), id(ne), id(sw), id(se)) -> Node. Minden csomópontot életben tart, így az id-k stabilak.
+        self.nodes: dict[tuple[int, int, int, int], Node] = {}
+        # (id(node), j) -> a node középső negyede 2^j generációval később
+        self.results: dict[tuple[int, int], Node] = {}
+        # level -> üres csomópont
+        self._empty: dict[int, Node] = {0: _OFF}
+
+    def join(self, nw: Node, ne: Node, sw: Node, se: Node) -> Node:
+        key = (id(nw), id(ne), id(sw), id(se))
+        node = self.nodes.get(key)
+        if node is None:
+            node = self.nodes[key] = Node(
+                nw, ne, sw, se, nw.level + 1,
+                nw.population + ne.population + sw.population + se.population,
+                hash((nw.hash, ne.hash, sw.hash, se.hash)),
+            )
+
+        return node
+
+    def empty(self, level: int) -> Node:
+        node = self._empty.get(level)
+        if node is None:
+            child = self.empty(level - 1)
+            node = self._empty[level] = self.join(child, child, child, child)
+
+        return node
+
+    def centre(self, node: Node) -> Node:
+        # Eggyel nagyobb szintű csomópont, aminek a közepén ott van az eredeti
+        empty = self.empty(node.level - 1)
+        return self.join(
+            self.join(empty, empty, empty, node.nw), self.join(empty, empty, node.ne, empty),
+            self.join(empty, node.sw, empty, empty), self.join(node.se, empty, empty, empty),
+        )
+
+    def canonical(self, node: Node, memo: dict[int, Node]) -> Node:
+        # Egy másik store-ból származó csomópont újraépítése ebben a store-ban
+        if node.level == 0:
+            return node
+
+        result = memo.get(id(node))
+        if result is None:
+            result = memo[id(node)] = self.join(
+                self.canonical(node.nw, memo), self.canonical(node.ne, memo),
+                self.canonical(node.sw, memo), self.canonical(node.se, memo),
+            )
+
+        return result
+
+    def life_4x4(self, node: Node) -> Node:
+        # A 4x4-es négyzetet egy 16 bites maszkba kódoljuk (y * 4 + x. bit), és ez alapján keressük ki
+        # a középső 2x2-es következő állapotát.
+        rows = (
+            (node.nw.nw, node.nw.ne, node.ne.nw, node.ne.ne),
+            (node.nw.sw, node.nw.se, node.ne.sw, node.ne.se),
+            (node.sw.nw, node.sw.ne, node.se.nw, node.se.ne),
+            (node.sw.sw, node.sw.se, node.se.sw, node.se.se),
+        )
+        mask = 0
+        for y, row in enumerate(rows):
+            for x, cell in enumerate(row):
+                mask |= cell.population << (y * 4 + x)
+
+        centre = _LIFE_4X4.get(mask)
+        if centre is None:
+            states = []
+            for y, x in ((1, 1), (1, 2), (2, 1), (2, 2)):
+                alive = (mask >> (y * 4 + x)) & 1
+                n = sum(
+                    (mask >> ((y + dy) * 4 + x + dx)) & 1
+                    for dx, dy in _OFFSETS
+                )
+                states.append(int(n == 3 or (alive and n == 2)))
+
+            centre = _LIFE_4X4[mask] = tuple(states)
+
+        return self.join(*(_ON if state else _OFF for state in centre))
+
+    def successor(self, node: Node, j: int) -> Node:
+        """
+        A k szintű node középső, k - 1 szintű negyede 2^j generációval később (j <= k - 2).
+        """
+
+        if node.population == 0:
+            return node.nw
+
+        if node.level == 2:
+            return self.life_4x4(node)
+
+        key = (id(node), j)
+        if (result := self.results.get(key)) is not None:
+            return result
+
+        join = self.join
+        successor = self.successor
+        nw, ne, sw, se = node.nw, node.ne, node.sw, node.se
+
+        # Kilenc, egymást átfedő k - 1 szintű részcsomópont középső negyede
+        c1 = successor(join(nw.nw, nw.ne, nw.sw, nw.se), j)
+        c2 = successor(join(nw.ne, ne.nw, nw.se, ne.sw), j)
+        c3 = successor(join(ne.nw, ne.ne, ne.sw, ne.se), j)
+        c4 = successor(join(nw.sw, nw.se, sw.nw, sw.ne), j)
+        c5 = successor(join(nw.se, ne.sw, sw.ne, se.nw), j)
+        c6 = successor(join(ne.sw, ne.se, se.nw, se.ne), j)
+        c7 = successor(join(sw.nw, sw.ne, sw.sw, sw.se), j)
+        c8 = successor(join(sw.ne, se.nw, sw.se, se.sw), j)
+        c9 = successor(join(se.nw, se.ne, se.sw, se.se), j)
+
+        if j < node.level - 2:
+            # A kért lépésszám már megvolt, csak össze kell rakni a középső negyedet
+            result = join(
+                join(c1.se, c2.sw, c4.ne, c5.nw),
+                join(c2.se, c3.sw, c5.ne, c6.nw),
+                join(c4.se, c5.sw, c7.ne, c8.nw),
+                join(c5.se, c6.sw, c8.ne, c9.nw),
+            )
+
+        else:
+            # Még egyszer ugyanannyit kell lépni: 2^(k-3) + 2^(k-3) = 2^(k-2)
+            result = join(
+                successor(join(c1, c2, c4, c5), j),
+                successor(join(c2, c3, c5, c6), j),
+                successor(join(c4, c5, c7, c8), j),
+                successor(join(c5, c6, c8, c9), j),
+            )
+
+        self.results[key] = result
+        return result
+
+    def set_cell(self, node: Node, x: int, y: int, alive: bool) -> Node:
+        # x, y a node bal felső sarkához képest
+        if node.level == 0:
+            return _ON if alive else _OFF
+
+        half = 1 << (node.level - 1)
+        nw, ne, sw, se = node.nw, node.ne, node.sw, node.se
+        if y < half:
+            if x < half:
+                nw = self.set_cell(nw, x, y, alive)
+            else:
+                ne = self.set_cell(ne, x - half, y, alive)
+        else:
+            if x < half:
+                sw = self.set_cell(sw, x, y - half, alive)
+            else:
+                se = self.set_cell(se, x - half, y - half, alive)
+
+        return self.join(nw, ne, sw, se)
+
+
+def _collect(node: Node, left: int, top: int, board: list[list[bool]]):
+    # Az ablakba (board) eső élő sejtek beírása. left, top a node bal felső sarka az ablakhoz képest.
+    size = 1 << node.level
+    if node.population == 0 \
+            or left >= len(board[0]) or top >= len(board) or left + size <= 0 or top + size <= 0:
+        return
+
+    if node.level == 0:
+        board[top][left] = True
+        return
+
+    half = size >> 1
+    _collect(node.nw, left, top, board)
+    _collect(node.ne, left + half, top, board)
+    _collect(node.sw, left, top + half, board)
+    _collect(node.se, left + half, top + half, board)
+
+
+class HashlifeUniverse:
+    """
+    Hashlife univerzum: a sejtek egy memoizált négyfában élnek, így az ismétlődő mintázatok
+    (ágyúk, űrhajók, oszcillátorok) léptetése töredék munka, és hatalmas ugrások is megtehetők
+    egyszerre (lásd step).
+    Fontos különbség a többi univerzumhoz képest: ez a sík végtelen, a width x height csak egy
+    ablak rá. Az ablakból kirepülő sejtek tovább élnek, és az ablak szélén sem halnak meg
+    a sejtek csak azért, mert nincs szomszéd az ablakon kívül.
+    """
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+
+        # A gyökér mindig a sík origója köré van centrálva: a bal felső sarka (-half, -half),
+        # ahol half = 2^(level - 1). Az ablak (0, 0)-tól (width, height)-ig tart.
+        self._store = _NodeStore()
+        self._root = self._store.empty(3)
+        self._fit()
+
+    def _fit(self):
+        while (1 << (self._root.level - 1)) < max(self.width, self.height):
+            self._root = self._store.centre(self._root)
+
+    def _compact(self):
+        # A store-ok soha nem felejtenek, ezért ha túl nagyra nőttek, újat kezdünk, és csak
+        # az aktuális gyökérből elérhető csomópontokat visszük át.
+        if len(self._store.nodes) > HASHLIFE_MAX_NODES:
+            store = _NodeStore()
+            self._root = store.canonical(self._root, {})
+            self._store = store
+
+    def __setitem__(self, key: tuple[int, int], is_alive: bool):
+        x, y = key
+        self._fit()
+        half = 1 << (self._root.level - 1)
+        self._root = self._store.set_cell(self._root, x + half, y + half, is_alive)
+
+    def __getitem__(self, key: tuple[int, int]) -> bool:
+        x, y = key
+        self._fit()
+        half = 1 << (self._root.level - 1)
+        x += half
+        y += half
+
+        node = self._root
+        while node.level > 0 and node.population:
+            half = 1 << (node.level - 1)
+            if y < half:
+                node = node.nw if x < half else node.ne
+            else:
+                node = node.sw if x < half else node.se
+            x &= half - 1
+            y &= half - 1
+
+        return bool(node.population)
+
+    def load_from_config(self, tabla: list[list[str]], alive_char: str):
+        """
+        Lásd: Universe.load_from_config
+        """
+
+        for row_ptr, row in enumerate(tabla):
+            for col_ptr, cell in enumerate(row):
+                self[col_ptr, row_ptr] = cell == alive_char
+
+    def step(self, generations: int = 1):
+        """
+        Léptet az univerzumon generations generációt. A lépésszámot kettő hatványaira bontja,
+        és mindegyiket egyetlen _NodeStore.successor hívással teszi meg.
+        """
+
+        while generations > 0:
+            j = generations.bit_length() - 1
+
+            # Annyira kell kibővíteni a gyökeret, hogy 2^j generáció alatt se nőhessen ki
+            # a mintázat az eredményként kapott középső negyedből.
+            node = self._root
+            while node.level < j + 3 or not _is_padded(node):
+                node = self._store.centre(node)
+
+            self._root = self._store.successor(node, j)
+            generations -= 1 << j
+            self._compact()
+
+    def tick(self) -> np.ndarray:
+        """
+        Lefuttat egy iterációt az univerzumban, és visszatér az ablakban megváltozott
+        sejtek koordinátáival: egy (n, 2) alakú tömb, soronként [y, x].
+        """
+
+        before = np.array(self.to_list(), dtype=bool)
+        self.step()
+        after = np.array(self.to_list(), dtype=bool)
+
+        return np.argwhere(before != after)
+
+    def to_list(self) -> list[list[bool]]:
+        """
+        Lásd: Universe.to_list. Csak az ablakba eső sejteket adja vissza.
+        """
+
+        board = [[False] * self.width for _ in range(self.height)]
+        half = 1 << (self._root.level - 1)
+        _collect(self._root, -half, -half, board)
+
+        return board
+
+
 class Config(TypedDict):
     """
     Ez hordozza a config fájlból beolvasott adatokat
@@ -270,6 +826,17 @@ class Config(TypedDict):
     tabla: list[list[str]]
 
 
+def _parse_cell_char(line: str, prefix: str) -> Optional[str]:
+    """
+    Idézőjelek közti egyetlen egy karaktert várunk el a prefix (és esetleges szóközök) után.
+    Ha a sor nem ilyen, None-nal tér vissza.
+    """
+
+    value = line[len(prefix):].lstrip()
+    if len(value) == 3 and value[0] == '"' and value[2] == '"':
+        return value[1].strip()
+
+
 def read_config_file(filename: str) -> Config:
     """
     Parse-olja a kapott filename útvonalon található fájlt.
@@ -279,27 +846,35 @@ def read_config_file(filename: str) -> Config:
     not_alive_char = None
     alive_char = None
 
-    # Hasonlóan az Universe felépítéséhez, ez a metódus is két menetben olvassa be a fájlt.
+    # Egyetlen menetben olvassuk be a fájlt, a state mondja meg, hol tartunk:
+    # 'top': a fájl legfelső szintjén vagyunk
+    # 'in_table_marker': a "tabla:" után a nyitó idézőjelet várjuk
+    # 'in_table': a tábla sorait olvassuk, amíg a záró idézőjel meg nem jön
+    state = 'top'
     with open(filename, 'r') as f:
         for line in f:
             line = line.strip()
-            if line.startswith('tabla:'):
+            if state == 'in_table_marker':
+                assert line == '"'
+                state = 'in_table'
+
+            elif state == 'in_table':
+                if line == '"':
+                    state = 'top'
+                else:
+                    table_lines.append(line)
+
+            elif line.startswith('tabla:'):
                 # Táblázat kontextusában vagyunk.
-                assert next(f).strip() == '"'
-                #  Elkezdjük pörgetni a fájl sorait
-                for table_line in f:
-                    table_line = table_line.strip()
-                    if table_line == '"':
-                        break
-                    else:
-                        table_lines.append(table_line)
-
-            # Idézőjelek közti egyetlen egy karaktert várunk el.
-            elif match := re.match(r'^halott_sejt:\s*"(.)"$', line):
-                not_alive_char = match[1].strip()
-
-            elif match := re.match(r'^elo_sejt:\s*"(.)"$', line):
-                alive_char = match[1].strip()
+                state = 'in_table_marker'
+
+            elif line.startswith('halott_sejt:'):
+                if (char := _parse_cell_char(line, 'halott_sejt:')) is not None:
+                    not_alive_char = char
+
+            elif line.startswith('elo_sejt:'):
+                if (char := _parse_cell_char(line, 'elo_sejt:')) is not None:
+                    alive_char = char
 
     # Jönnek az ellenőrzések
     if not alive_char:
@@ -308,21 +883,21 @@ def read_config_file(filename: str) -> Config:
     if not not_alive_char:
         raise AttributeError
 
+    # Ezzel a fordítótáblával a halott- és élő karakterek törlődnek a sorokból
+    delete_cell_chars = str.maketrans('', '', alive_char + not_alive_char)
+
     table = []
-    table_line_lengths = set()
+    expected_len = len(table_lines[0]) if table_lines else 0
     for table_line in table_lines:
-        line_chars = list(table_line)
-        # Nem maradhat semmilyen karakter se, ha kivonjuk a táblázat sorának karaktereiből képzett halmazból a
-        # halott- és élő karakterek halmazát.
-        if set(line_chars) - {alive_char, not_alive_char} != set():
+        # Nem maradhat semmilyen karakter se, ha kitöröljük a sorból a halott- és élő karaktereket.
+        if table_line.translate(delete_cell_chars):
             raise ValueError
 
-        table_line_lengths.add(len(line_chars))
         # A sorhosszok se bóklászhatnak össze-vissza
-        if not len(set(table_line_lengths)) == 1:
+        if len(table_line) != expected_len:
             raise ValueError
 
-        table.append(line_chars)
+        table.append(list(table_line))
 
     return Config(
         halott_sejt=not_alive_char,
@@ -341,22 +916,12 @@ def next_state(config: Config):
 
     # Bemásoljuk a configból a táblát az univerzumba
     universe = Universe(width, height)
-    for row_ptr, row in enumerate(config['tabla']):
-        for col_ptr, cell in enumerate(row):
-            if cell == config['elo_sejt']:
-                universe[col_ptr, row_ptr] = True
+    universe.load_from_config(config['tabla'], config['elo_sejt'])
 
     universe.tick()
 
-    table = universe.to_list()
-    for row_ptr, row in enumerate(table):
-        for col_ptr, is_alive in enumerate(row):
-            if is_alive:
-                char = config['elo_sejt']
-            else:
-                char = config['halott_sejt']
-
-            table[row_ptr][col_ptr] = char
+    # Visszafelé is egy menetben: az élő sejtek helyére az élő, a többi helyére a halott karakter kerül
+    table = np.where(universe.view, config['elo_sejt'], config['halott_sejt']).tolist()
 
     return Config(
         elo_sejt=config['elo_sejt'],
@@ -365,7 +930,112 @@ def next_state(config: Config):
     )
 
 
+class Renderer:
+    """
+    Az univerzum kirajzolása egy tkinter-es canvas-ra.
+    A szimuláció és a kirajzolás szét van választva: a _simulate TICK ms-onként lépteti az
+    univerzumot, és gyűjti a megváltozott sejteket (self.dirty), a _paint pedig akkor fut,
+    amikor a Tk ráér (after_idle), és egyszerre rajzolja ki az összegyűlt változásokat.
+    Ha semmi nem változott (stabil állapot), akkor nincs mit kirajzolni.
+    A canvas-on csak az élő sejteknek van rectangle-je: a halott sejtek a canvas háttere, a rács
+    pedig egyszer, induláskor rajzolódik ki. Így a Tk-nak csak annyi elemet kell kezelnie,
+    ahány élő sejt van.
+    """
+
+    def __init__(self, root: tk.Tk, universe, width: int, height: int):
+        self.root = root
+        self.universe = universe
+        self.width = width
+        self.height = height
+
+        self.canvas = tk.Canvas(root, width=width * CELL_SIZE_PX,
+                                height=height * CELL_SIZE_PX, bg=CELL_DEAD_COLOR)
+        self.canvas.pack()
+
+        # Statikus háttér: a rács sosem változik
+        for x in range(width + 1):
+            self.canvas.create_line(x * CELL_SIZE_PX, 0, x * CELL_SIZE_PX, height * CELL_SIZE_PX)
+        for y in range(height + 1):
+            self.canvas.create_line(0, y * CELL_SIZE_PX, width * CELL_SIZE_PX, y * CELL_SIZE_PX)
+
+        # Az élő sejtek tkinter-es rectangle referenciái (y, x) szerint
+        self._alive_rects: dict[tuple[int, int], int] = {}
+
+        # A legutóbbi kirajzolás óta megváltozott sejtek (y, x) koordinátái
+        self.dirty: set[tuple[int, int]] = set()
+        # Igaz, ha már be van ütemezve egy _paint
+        self._paint_pending = False
+
+    def start(self):
+        # Első render, simán csak az univerzum állapotával. Kezdetben minden sejt halottként
+        # látszik, így elég az élő sejteket kirajzolni.
+        self.dirty.update(
+            (y, x)
+            for y, row in enumerate(self.universe.to_list())
+            for x, is_alive in enumerate(row)
+            if is_alive
+        )
+        self._paint()
+        self.root.after(TICK, self._simulate)
+
+    def _simulate(self):
+        """
+        Lefuttat egy iterációt, és ha változott valami, beütemezi a kirajzolást.
+        """
+
+        self.dirty.update(map(tuple, self.universe.tick()))
+
+        if self.dirty and not self._paint_pending:
+            self._paint_pending = True
+            self.root.after_idle(self._paint)
+
+        # Szimulációs loop
+        self.root.after(TICK, self._simulate)
+
+    def _paint(self):
+        """
+        Az utolsó kirajzolás óta megváltozott sejtek renderelése: a megszületett sejteknek
+        rectangle-t hozunk létre, az elhaltakét töröljük.
+        """
+
+        self._paint_pending = False
+        if not self.dirty:
+            return
+
+        dead_rects = []
+        for key in self.dirty:
+            y, x = key
+            # Több tick is összegyűlhetett, ezért mindig az aktuális állapotot rajzoljuk ki
+            rect = self._alive_rects.get(key)
+            if self.universe[x, y]:
+                if rect is None:
+                    self._alive_rects[key] = self.canvas.create_rectangle(
+                        x * CELL_SIZE_PX, y * CELL_SIZE_PX,
+                        (x + 1) * CELL_SIZE_PX, (y + 1) * CELL_SIZE_PX,
+                        fill=CELL_ALIVE_COLOR,
+                    )
+
+            elif rect is not None:
+                dead_rects.append(self._alive_rects.pop(key))
+
+        self.dirty.clear()
+
+        # Az elhalt sejtek rectangle-jeit egyetlen Tk hívással töröljük
+        if dead_rects:
+            self.canvas.delete(*dead_rects)
+
+
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Game of Life')
+    backend = parser.add_mutually_exclusive_group()
+    backend.add_argument('--reference', action='store_true',
+                         help='a tisztán Python-os, sejt objektumos referencia implementáció használata')
+    backend.add_argument('--bitpacked', action='store_true',
+                         help='bitekbe csomagolt tábla, 64 sejt szavanként')
+    backend.add_argument('--hashlife', action='store_true',
+                         help='hashlife univerzum: végtelen sík, az ablak csak egy része')
+    args = parser.parse_args()
+
     # A config_file.config mindig a main.py mellett kell hogy létezzen.
     config = read_config_file(
         str(pathlib.Path(__file__).parent / 'config_file.config'))
@@ -377,47 +1047,21 @@ if __name__ == '__main__':
     height = len(config['tabla'])
 
     # Átmásoljuk a config-ból a sejteket az univerzumba
-    universe = Universe(width, height)
-    for row_ptr, row in enumerate(config['tabla']):
-        for col_ptr, cell in enumerate(row):
-            if cell == config['elo_sejt']:
-                universe[col_ptr, row_ptr] = True
+    if args.reference:
+        universe_class = CellUniverse
+    elif args.bitpacked:
+        universe_class = BitPackedUniverse
+    elif args.hashlife:
+        universe_class = HashlifeUniverse
+    else:
+        universe_class = Universe
+
+    universe = universe_class(width, height)
+    universe.load_from_config(config['tabla'], config['elo_sejt'])
 
     root = tk.Tk()
     root.title("Game of Life")
     root.geometry(f'{width * CELL_SIZE_PX}x{height * CELL_SIZE_PX}')
 
-    canvas = tk.Canvas(root, width=width * CELL_SIZE_PX,
-                       height=height * CELL_SIZE_PX)
-    canvas.pack()
-
-    def render(tick: bool = True):
-        """
-        Alapállapot renderelése, ha tick = False, egyébként pedig
-        az új állapot során változott Cell-ek renderelése.
-        """
-
-        if tick:
-            cells = universe.tick()
-        else:
-            cells = universe.cells
-
-        for cell in cells:
-            fill = CELL_DEAD_COLOR if not cell.is_alive else CELL_ALIVE_COLOR
-
-            if (rect := cell.rectangle) is None:
-                # Pótoljuk a hiányzó rectangle-öket
-                cell.rectangle = rect = canvas.create_rectangle(
-                    cell.pos_x * CELL_SIZE_PX, cell.pos_y * CELL_SIZE_PX,
-                    (cell.pos_x + 1) * CELL_SIZE_PX, (cell.pos_y + 1) * CELL_SIZE_PX,
-                )
-
-            # Rectangle-ök átszínezése
-            canvas.itemconfig(rect, fill=fill)
-
-        # Render loop
-        root.after(TICK, render)
-
-    # Első render, simán csak az univerzum állapotával
-    render(tick=False)
+    Renderer(root, universe, width, height).start()
     root.mainloop()
@@ -0,0 +1,85 @@
+"""
+A HashlifeUniverse ellenőrzése egy nyers erős, végtelen síkon futó referencia ellen.
+"""
+
+import random
+
+import pytest
+
+pytest.importorskip('numpy')
+pytest.importorskip('tkinter')
+
+import game_of_life  # noqa: E402
+from game_of_life import HashlifeUniverse  # noqa: E402
+
+
+def reference_step(alive: set[tuple[int, int]]) -> set[tuple[int, int]]:
+    # Egy generáció a végtelen síkon, az élő sejtek (x, y) halmazán
+    counts: dict[tuple[int, int], int] = {}
+    for x, y in alive:
+        for dx, dy in game_of_life._OFFSETS:
+            key = (x + dx, y + dy)
+            counts[key] = counts.get(key, 0) + 1
+
+    return {key for key, n in counts.items() if n == 3 or (n == 2 and key in alive)}
+
+
+def window(alive: set[tuple[int, int]], width: int, height: int) -> list[list[bool]]:
+    return [[(x, y) in alive for x in range(width)] for y in range(height)]
+
+
+def random_universe(seed: int, width: int, height: int):
+    rng = random.Random(seed)
+    alive = {(x, y) for y in range(height) for x in range(width) if rng.random() < 0.35}
+    universe = HashlifeUniverse(width, height)
+    for x, y in alive:
+        universe[x, y] = True
+
+    return universe, alive
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_tick_matches_reference(seed):
+    width, height = 17, 11
+    universe, alive = random_universe(seed, width, height)
+
+    for _ in range(8):
+        before = window(alive, width, height)
+        changed = universe.tick()
+        alive = reference_step(alive)
+        after = window(alive, width, height)
+
+        assert universe.to_list() == after
+        assert {(int(y), int(x)) for y, x in changed} == {
+            (y, x) for y in range(height) for x in range(width) if before[y][x] != after[y][x]
+        }
+
+
+@pytest.mark.parametrize('generations', [1, 2, 3, 7, 16, 37])
+def test_step_matches_reference(generations):
+    width, height = 12, 9
+    universe, alive = random_universe(generations, width, height)
+
+    universe.step(generations)
+    for _ in range(generations):
+        alive = reference_step(alive)
+
+    assert universe.to_list() == window(alive, width, height)
+    assert universe._root.population == len(alive)
+
+
+def test_caches_are_bounded(monkeypatch):
+    monkeypatch.setattr(game_of_life, 'HASHLIFE_MAX_NODES', 200)
+    universe = HashlifeUniverse(10, 10)
+    glider = {(1, 0), (2, 1), (0, 2), (1, 2), (2, 2)}
+    for x, y in glider:
+        universe[x, y] = True
+
+    for _ in range(400):
+        universe.step()
+        assert len(universe._store.nodes) <= 200 + 100
+
+    # 400 generáció után a sikló 100 cellát haladt átlósan
+    alive = {(x + 100, y + 100) for x, y in glider}
+    assert universe.to_list() == window(alive, 10, 10)
+    assert universe._root.population == 5